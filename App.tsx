@@ -1,5 +1,5 @@
 
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import Sidebar from './components/Sidebar';
 import Dashboard from './components/Dashboard';
 import { Channel, Folder, Video, AnalysisPeriod } from './types';
@@ -9,6 +9,8 @@ import { CheckCircle2, AlertCircle, Settings } from 'lucide-react';
 
 const STORAGE_KEY = 'yt_dashboard_state';
 const VIDEO_CACHE_KEY = 'yt_dashboard_videos';
+// 이 시간 안에서는 캐시된 영상 데이터를 그대로 사용하고 API를 다시 호출하지 않음
+const REFRESH_TTL_MS = 30 * 60 * 1000;
 
 /**
  * [중요] 여기에 본인의 YouTube Data API v3 키를 입력하세요.
@@ -168,7 +170,7 @@ const App: React.FC = () => {
   const refreshData = useCallback(async (customPeriod?: AnalysisPeriod, force = false) => {
     if (!apiKey || channels.length === 0) return;
     const now = Date.now();
-    if (!force && !customPeriod && lastFetched && (now - lastFetched < 30 * 60 * 1000)) return;
+    if (!force && !customPeriod && lastFetched && (now - lastFetched < REFRESH_TTL_MS)) return;
     
     setIsLoading(true);
     try {
@@ -189,6 +191,9 @@ const App: React.FC = () => {
     if (apiKey && channels.length > 0) {
       if (dataPeriod !== period || !lastFetched) {
         refreshData(period);
+      } else if (Date.now() - lastFetched >= REFRESH_TTL_MS) {
+        // TTL이 지난 캐시는 일단 화면에 보여주면서 백그라운드로 갱신 (stale-while-revalidate)
+        refreshData();
       }
     }
   }, [apiKey, channels, period, dataPeriod, lastFetched, refreshData]);
@@ -197,6 +202,9 @@ const App: React.FC = () => {
     setFolders([...folders, { id: `f-${Date.now()}`, name }]);
   };
 
+  // 중복 체크용 ID 집합 (채널이 많아져도 추가 시 O(1) 조회)
+  const channelIds = useMemo(() => new Set(channels.map(c => c.id)), [channels]);
+
   const addChannel = async (identifier: string, folderId: string) => {
     if (!apiKey) {
       showToast("코드 내부에 API 키가 설정되지 않았습니다.", 'error');
@@ -206,7 +214,7 @@ const App: React.FC = () => {
     setIsLoading(true);
     try {
       const info = await fetchChannelInfo(identifier, apiKey);
-      if (channels.some(c => c.id === info.id)) {
+      if (channelIds.has(info.id)) {
         showToast("이미 등록된 채널입니다.", 'error');
         return;
       }
@@ -276,10 +284,11 @@ const App: React.FC = () => {
                   <div className="space-y-3">
                       <div>
                           <label className="text-[10px] font-bold text-slate-500 mb-1 block">YouTube Data API Key</label>
-                          <input 
-                              type="password" 
-                              value={apiKey} 
-                              onChange={(e) => setApiKey(e.target.value)}
+                          {/* 키 입력 중에는 앱 전체를 리렌더/리페치하지 않도록 블러 시점에만 반영 */}
+                          <input
+                              type="password"
+                              defaultValue={apiKey}
+                              onBlur={(e) => setApiKey(e.target.value)}
                               placeholder="AIza..."
                               className="w-full px-3 py-2 text-xs border border-slate-300 rounded-lg focus:ring-2 focus:ring-blue-600 outline-none"
                           />
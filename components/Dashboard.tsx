@@ -33,27 +33,52 @@ const Dashboard: React.FC<DashboardProps> = ({
 }) => {
   const [sortOption, setSortOption] = useState<SortOption>(SortOption.VIEWS_DESC);
 
-  const scopeVideos = useMemo(() => {
-    if (selectedChannelId) {
-        return videos.filter(v => v.channelId === selectedChannelId);
+  // 숏폼 여부는 영상별로 불변이므로 스코프가 바뀔 때마다 거르지 않고 한 번만 분리
+  const longVideos = useMemo(() => videos.filter(v => !v.isShort), [videos]);
+
+  // 채널별 영상 인덱스(롱폼만): 필터가 바뀔 때마다 전체 영상을 재스캔하지 않도록 한 번만 구축
+  const videosByChannel = useMemo(() => {
+    const map = new Map<string, Video[]>();
+    for (const v of longVideos) {
+      const list = map.get(v.channelId);
+      if (list) list.push(v);
+      else map.set(v.channelId, [v]);
     }
-    if (selectedFolderId) {
-        const folderChannelIds = channels.filter(c => c.folderId === selectedFolderId).map(c => c.id);
-        return videos.filter(v => folderChannelIds.includes(v.channelId));
+    return map;
+  }, [longVideos]);
+
+  // 폴더 → 소속 채널 id 인덱스: 폴더 선택 시 채널 목록을 다시 스캔하지 않음
+  const channelIdsByFolder = useMemo(() => {
+    const map = new Map<string, string[]>();
+    for (const c of channels) {
+      const list = map.get(c.folderId);
+      if (list) list.push(c.id);
+      else map.set(c.folderId, [c.id]);
     }
-    return videos;
-  }, [videos, selectedFolderId, selectedChannelId, channels]);
+    return map;
+  }, [channels]);
 
   const filteredVideos = useMemo(() => {
-    return scopeVideos.filter(v => !v.isShort);
-  }, [scopeVideos]);
+    if (selectedChannelId) {
+        return videosByChannel.get(selectedChannelId) || [];
+    }
+    if (selectedFolderId) {
+        const folderChannelIds = channelIdsByFolder.get(selectedFolderId) || [];
+        return folderChannelIds.flatMap(id => videosByChannel.get(id) || []);
+    }
+    return longVideos;
+  }, [longVideos, videosByChannel, channelIdsByFolder, selectedFolderId, selectedChannelId]);
 
   const stats = useMemo(() => {
     const count = filteredVideos.length;
     if (count === 0) return { count: 0, avgViews: 0, avgLikes: 0, avgComments: 0 };
-    const totalViews = filteredVideos.reduce((acc, v) => acc + v.viewCount, 0);
-    const totalLikes = filteredVideos.reduce((acc, v) => acc + v.likeCount, 0);
-    const totalComments = filteredVideos.reduce((acc, v) => acc + v.commentCount, 0);
+    // 세 지표를 한 번의 순회로 집계 (리스트를 세 번 돌지 않도록)
+    let totalViews = 0, totalLikes = 0, totalComments = 0;
+    for (const v of filteredVideos) {
+      totalViews += v.viewCount;
+      totalLikes += v.likeCount;
+      totalComments += v.commentCount;
+    }
     return {
       count,
       avgViews: Math.round(totalViews / count),
@@ -63,10 +88,16 @@ const Dashboard: React.FC<DashboardProps> = ({
   }, [filteredVideos]);
 
   const chartData = useMemo(() => {
-      return [...filteredVideos]
-        .sort((a, b) => b.viewCount - a.viewCount)
-        .slice(0, 5)
-        .map(v => ({
+      // 전체를 복사·정렬하지 않고 한 번의 순회로 조회수 상위 5개만 유지
+      const top: Video[] = [];
+      for (const v of filteredVideos) {
+        if (top.length === 5 && v.viewCount <= top[4].viewCount) continue;
+        let i = top.length;
+        while (i > 0 && top[i - 1].viewCount < v.viewCount) i--;
+        top.splice(i, 0, v);
+        if (top.length > 5) top.pop();
+      }
+      return top.map(v => ({
             name: v.title.length > 12 ? v.title.substring(0, 12) + '...' : v.title,
             fullTitle: v.title,
             views: v.viewCount,
@@ -1,5 +1,5 @@
 
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { Folder, Channel } from '../types';
 import { Plus, Trash2, FolderPlus, Youtube, RefreshCw, Folder as FolderIcon, GripVertical, ChevronRight, ChevronDown, Share2, BarChart3, ExternalLink } from 'lucide-react';
 
@@ -107,6 +107,17 @@ const Sidebar: React.FC<SidebarProps> = ({
     if (channelId) moveChannel(channelId, targetFolderId);
   };
 
+  // 폴더별 채널 목록을 한 번만 그룹핑 (폴더마다 전체 채널을 다시 스캔하지 않도록)
+  const channelsByFolder = useMemo(() => {
+    const map = new Map<string, Channel[]>();
+    for (const c of channels) {
+      const list = map.get(c.folderId);
+      if (list) list.push(c);
+      else map.set(c.folderId, [c]);
+    }
+    return map;
+  }, [channels]);
+
   const DEFAULT_THUMBNAIL = "https://www.gstatic.com/youtube/img/branding/favicon/favicon_144x144.png";
 
   return (
@@ -185,7 +196,7 @@ const Sidebar: React.FC<SidebarProps> = ({
 
                 {folders.map(folder => {
                     const isFolderSelected = selectedFolderId === folder.id;
-                    const folderChannels = channels.filter(c => c.folderId === folder.id);
+                    const folderChannels = channelsByFolder.get(folder.id) || [];
                     return (
                         <div key={folder.id} className={`rounded-xl border transition-all ${isFolderSelected ? 'bg-slate-50 border-blue-200' : 'bg-white border-slate-100'}`}>
                             <button
@@ -1,5 +1,5 @@
 
-import React from 'react';
+import React, { useMemo } from 'react';
 import { Video, SortOption, AnalysisPeriod } from '../types';
 import { ExternalLink, ThumbsUp, MessageCircle, ArrowUp, ArrowDown } from 'lucide-react';
 
@@ -12,7 +12,8 @@ interface VideoTableProps {
 
 const VideoTable: React.FC<VideoTableProps> = ({ videos, sortOption, setSortOption, period }) => {
 
-  const sortedVideos = [...videos].sort((a, b) => {
+  // 정렬 결과 메모이즈: 목록/정렬 기준이 그대로면 리렌더 시 재정렬하지 않음
+  const sortedVideos = useMemo(() => [...videos].sort((a, b) => {
     switch (sortOption) {
       case SortOption.VIEWS_DESC: return b.viewCount - a.viewCount;
       case SortOption.VIEWS_ASC: return a.viewCount - b.viewCount;
@@ -20,11 +21,12 @@ const VideoTable: React.FC<VideoTableProps> = ({ videos, sortOption, setSortOpti
       case SortOption.LIKES_ASC: return a.likeCount - b.likeCount;
       case SortOption.COMMENTS_DESC: return b.commentCount - a.commentCount;
       case SortOption.COMMENTS_ASC: return a.commentCount - b.commentCount;
-      case SortOption.DATE_DESC: return new Date(b.publishedAt).getTime() - new Date(a.publishedAt).getTime();
-      case SortOption.DATE_ASC: return new Date(a.publishedAt).getTime() - new Date(b.publishedAt).getTime();
+      // publishedAt은 고정 ISO(UTC) 포맷이라 문자열 비교가 시간순과 일치
+      case SortOption.DATE_DESC: return b.publishedAt.localeCompare(a.publishedAt);
+      case SortOption.DATE_ASC: return a.publishedAt.localeCompare(b.publishedAt);
       default: return 0;
     }
-  });
+  }), [videos, sortOption]);
 
   const handleSortClick = (category: 'VIEWS' | 'LIKES' | 'COMMENTS' | 'DATE') => {
     const desc = SortOption[`${category}_DESC` as keyof typeof SortOption];
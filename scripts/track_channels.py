@@ -3,6 +3,7 @@ import json
 import re
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -21,6 +22,7 @@ NOTION_TOKEN        = os.environ["NOTION_TOKEN"]
 NOTION_DATABASE_ID  = os.environ["NOTION_DATABASE_ID"]
 
 DAYS_BACK    = 7
+MAX_WORKERS  = 16
 YT_BASE      = "https://www.googleapis.com/youtube/v3"
 NOTION_BASE  = "https://api.notion.com/v1"
 
@@ -30,25 +32,52 @@ NOTION_HEADERS = {
     "Notion-Version": "2022-06-28",
 }
 
+# 모든 API 호출이 공유하는 세션 — keep-alive로 호출마다 TCP/TLS를 새로 맺지 않음
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS))
+
 
 # ── YouTube API ───────────────────────────────────────────
 
+_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+def parse_pt_seconds(duration: str) -> int:
+    """유튜브 ISO-8601 길이 문자열(PT#H#M#S)을 초 단위로 변환"""
+    match = _DURATION_RE.match(duration)
+    if not match:
+        return 0
+    h, m, s = match.groups()
+    return int(h or 0) * 3600 + int(m or 0) * 60 + int(s or 0)
+
+
+def parse_yt_timestamp(ts: str) -> datetime:
+    """유튜브 publishedAt 전용 파서 (항상 YYYY-MM-DDTHH:MM:SSZ 고정 포맷)"""
+    return datetime(
+        int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+        int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+        tzinfo=timezone.utc,
+    )
+
+
 def get_recent_videos(playlist_id: str, days_back: int = DAYS_BACK) -> list[dict]:
     """업로드 플레이리스트에서 최근 N일 영상 목록 반환 (1 unit/call)"""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
     videos, page_token = [], None
 
     while True:
+        # 결과가 최신순이므로 첫 페이지는 작게 요청 — 주간 윈도우에서는 대부분
+        # 한 페이지로 끝나고, 10개가 전부 기간 안일 때만 50개씩 이어서 가져온다.
         params = {
             "part": "contentDetails,snippet",
             "playlistId": playlist_id,
-            "maxResults": 50,
+            "maxResults": 50 if page_token else 10,
             "key": YOUTUBE_API_KEY,
         }
         if page_token:
             params["pageToken"] = page_token
 
-        res = requests.get(f"{YT_BASE}/playlistItems", params=params, timeout=30)
+        res = _session.get(f"{YT_BASE}/playlistItems", params=params, timeout=30)
         data = res.json()
 
         if "error" in data:
@@ -58,7 +87,7 @@ def get_recent_videos(playlist_id: str, days_back: int = DAYS_BACK) -> list[dict
         stop = False
         for item in data.get("items", []):
             pub_str = item["snippet"]["publishedAt"]
-            pub_dt  = datetime.fromisoformat(pub_str.replace("Z", "+00:00"))
+            pub_dt  = parse_yt_timestamp(pub_str)
             if pub_dt < cutoff:
                 stop = True
                 break
@@ -89,18 +118,12 @@ def get_video_stats(video_ids: list[str]) -> dict:
             "id": ",".join(batch),
             "key": YOUTUBE_API_KEY,
         }
-        res  = requests.get(f"{YT_BASE}/videos", params=params, timeout=30)
+        res  = _session.get(f"{YT_BASE}/videos", params=params, timeout=30)
         data = res.json()
 
         for item in data.get("items", []):
             s = item["statistics"]
-            duration = item["contentDetails"].get("duration", "PT0S")
-            match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", duration)
-            total_sec = (
-                int(match.group(1) or 0) * 3600
-                + int(match.group(2) or 0) * 60
-                + int(match.group(3) or 0)
-            ) if match else 0
+            total_sec = parse_pt_seconds(item["contentDetails"].get("duration", "PT0S"))
 
             stats[item["id"]] = {
                 "viewCount":    int(s.get("viewCount", 0)),
@@ -111,6 +134,30 @@ def get_video_stats(video_ids: list[str]) -> dict:
     return stats
 
 
+def fetch_all_channel_videos(channels: list[dict]) -> dict[str, list[dict]]:
+    """채널별 최근 영상을 병렬 수집 (네트워크 대기가 대부분이라 스레드 풀 사용).
+
+    한 채널이 실패해도 나머지는 계속 수집하며, 결과는 {채널 id: 영상 목록}.
+    """
+    if not channels:
+        return {}
+
+    results: dict[str, list[dict]] = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(channels))) as pool:
+        futures = {
+            pool.submit(get_recent_videos, ch["uploadsPlaylistId"]): ch
+            for ch in channels
+        }
+        for future in as_completed(futures):
+            ch = futures[future]
+            try:
+                results[ch["id"]] = future.result()
+            except Exception as e:
+                print(f"  [수집 오류] {ch['title']}: {e}")
+                results[ch["id"]] = []
+    return results
+
+
 # ── Notion API ────────────────────────────────────────────
 
 def get_existing_page_id(video_id: str) -> Optional[str]:
@@ -119,7 +166,7 @@ def get_existing_page_id(video_id: str) -> Optional[str]:
         "filter": {"property": "Video ID", "rich_text": {"equals": video_id}},
         "page_size": 1,
     }
-    res = requests.post(
+    res = _session.post(
         f"{NOTION_BASE}/databases/{NOTION_DATABASE_ID}/query",
         headers=NOTION_HEADERS,
         json=payload,
@@ -155,7 +202,7 @@ def upsert_notion_page(video: dict, channel_title: str,
 
     for attempt in range(3):
         if page_id:
-            res = requests.patch(
+            res = _session.patch(
                 f"{NOTION_BASE}/pages/{page_id}",
                 headers=NOTION_HEADERS,
                 json={"properties": props},
@@ -168,7 +215,7 @@ def upsert_notion_page(video: dict, channel_title: str,
             }
             if video["thumbnail"]:
                 body["cover"] = {"type": "external", "external": {"url": video["thumbnail"]}}
-            res = requests.post(f"{NOTION_BASE}/pages", headers=NOTION_HEADERS,
+            res = _session.post(f"{NOTION_BASE}/pages", headers=NOTION_HEADERS,
                                 json=body, timeout=30)
 
         if res.status_code == 200:
@@ -195,15 +242,20 @@ def main():
     print(f"채널 수: {len(channels)}개 | 기간: 최근 {DAYS_BACK}일")
     print(f"{'='*50}")
 
+    videos_by_channel = fetch_all_channel_videos(channels)
+
+    # 통계는 채널 구분 없이 50개 단위로 묶어 조회 (요청 수·할당량 절약)
+    all_video_ids = [v["id"] for vids in videos_by_channel.values() for v in vids]
+    stats = get_video_stats(all_video_ids)
+
     for ch in channels:
         print(f"\n[{ch['title']}] 수집 중...")
-        videos = get_recent_videos(ch["uploadsPlaylistId"])
+        videos = videos_by_channel.get(ch["id"], [])
 
         if not videos:
             print(f"  → 최근 {DAYS_BACK}일 내 업로드 없음")
             continue
 
-        stats = get_video_stats([v["id"] for v in videos])
         for v in videos:
             v["stats"] = stats.get(v["id"],
                 {"viewCount": 0, "likeCount": 0, "commentCount": 0, "isShort": False})
@@ -213,8 +265,13 @@ def main():
             print(f"  → 숏츠만 있어서 스킵")
             continue
 
-        views = [v["stats"]["viewCount"] for v in videos if v["stats"]["viewCount"] > 0]
-        avg   = sum(views) / len(views) if views else 1
+        view_total = view_n = 0
+        for v in videos:
+            vc = v["stats"]["viewCount"]
+            if vc > 0:
+                view_total += vc
+                view_n += 1
+        avg = view_total / view_n if view_n else 1
 
         ch_created = ch_updated = ch_failed = 0
         for v in videos:
@@ -32,10 +32,24 @@ const handleApiError = async (response: Response) => {
 
 // --- Data API (Public) ---
 
+// 식별자 → 채널 정보 메모이즈 캐시.
+// 같은 핸들을 다시 추가할 때 검색 API(100 유닛) 경로를 재호출하지 않기 위함.
+const CHANNEL_INFO_TTL_MS = 24 * 60 * 60 * 1000;
+const channelInfoCache = new Map<string, { info: Omit<Channel, 'folderId'>; expires: number }>();
+
 export const fetchChannelInfo = async (identifier: string, apiKey: string): Promise<Omit<Channel, 'folderId'>> => {
   const cleanId = identifier.trim();
   if (!cleanId) throw new Error('채널 식별자를 입력해주세요.');
 
+  const cached = channelInfoCache.get(cleanId);
+  if (cached && cached.expires > Date.now()) return cached.info;
+
+  const info = await resolveChannelInfo(cleanId, apiKey);
+  channelInfoCache.set(cleanId, { info, expires: Date.now() + CHANNEL_INFO_TTL_MS });
+  return info;
+};
+
+const resolveChannelInfo = async (cleanId: string, apiKey: string): Promise<Omit<Channel, 'folderId'>> => {
   // 1. 채널 ID (UC...) 형식인 경우 (비용: 1 유닛)
   if (cleanId.startsWith('UC') && cleanId.length > 20) {
     const url = `${BASE_URL}/channels?part=snippet,contentDetails,statistics&id=${cleanId}&key=${apiKey}`;
@@ -173,13 +187,15 @@ export const fetchRecentVideos = async (channels: Channel[], apiKey: string, day
         data.items.forEach((item: any) => {
           const durationSec = parseDuration(item.contentDetails.duration);
           const channelInfo = videoToChannelMap[item.id];
+          const snippet = item.snippet;
+          const thumbs = snippet.thumbnails;
           finalVideos.push({
             id: item.id,
-            channelId: channelInfo?.channelId || item.snippet.channelId,
-            channelTitle: channelInfo?.channelTitle || item.snippet.channelTitle,
-            title: item.snippet.title,
-            thumbnail: item.snippet.thumbnails.medium?.url || item.snippet.thumbnails.default?.url,
-            publishedAt: item.snippet.publishedAt,
+            channelId: channelInfo?.channelId || snippet.channelId,
+            channelTitle: channelInfo?.channelTitle || snippet.channelTitle,
+            title: snippet.title,
+            thumbnail: (thumbs.medium || thumbs.default)?.url,
+            publishedAt: snippet.publishedAt,
             viewCount: parseInt(item.statistics.viewCount || '0'),
             likeCount: parseInt(item.statistics.likeCount || '0'),
             commentCount: parseInt(item.statistics.commentCount || '0'),